@@ -1,168 +1,490 @@
 import os
+import sys
+import logging
+import asyncio
+import httpx
+from aiolimiter import AsyncLimiter
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import datetime
 import time
-import json
+import orjson
+import hashlib
+import re
+from operator import itemgetter
 from dotenv import load_dotenv
 
 # Load local .env file
 load_dotenv()
 
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+_log_level_valid = isinstance(logging.getLevelName(LOG_LEVEL), int)
+logging.basicConfig(
+    level=LOG_LEVEL if _log_level_valid else logging.INFO,
+    format="%(asctime)s %(levelname)s %(message)s"
+)
+log = logging.getLogger("monitor")
+if not _log_level_valid:
+    log.warning("⚠️ Unknown LOG_LEVEL %r, using INFO", LOG_LEVEL)
+
+# LOG_LEVEL is for this script; keep the HTTP client's per-request lines out
+for noisy in ("httpx", "httpcore"):
+    logging.getLogger(noisy).setLevel(logging.WARNING)
+
 # Configuration
 API_KEY = os.environ.get("SEATS_AERO_API_KEY")
 WEBHOOK_URL = os.environ.get("DISCORD_WEBHOOK_URL")
 
 # Search Window: Today + 330 days
+SEARCH_DAYS = 330
 START_DATE = datetime.date.today()
-END_DATE = START_DATE + datetime.timedelta(days=330)
-
-# 1. Routes Reduced to JFK <-> HND only
-ROUTES = [
-    ("JFK", "HND"), 
-    ("HND", "JFK")
-]
-
-# 2. Flight Filter Reduced to JL3/4/5/6
-TARGET_FLIGHTS = {
-    "JL3", "JL4", 
-    "JL5", "JL6"
-}
+END_DATE = START_DATE + datetime.timedelta(days=SEARCH_DAYS)
+START_STR = START_DATE.isoformat()
+END_STR = END_DATE.isoformat()
+
+# Shared keep-alive pool for the synchronous calls (Discord)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Retry Discord on rate limits / server errors (POST is not retried by default)
+DISCORD_RETRY = Retry(
+    total=5,
+    backoff_factor=1.0,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=None,
+    respect_retry_after_header=True
+)
+for discord_host in ("https://discord.com", "https://discordapp.com"):
+    SESSION.mount(discord_host, HTTPAdapter(max_retries=DISCORD_RETRY))
+
+# Alerts already sent, so reruns don't repeat them for 24h
+NOTIFIED_PATH = os.environ.get("NOTIFIED_PATH", "notified.json")
+NOTIFY_TTL = 86400  # seconds
+
+# On-disk response cache (award inventory moves slowly between cron ticks)
+CACHE_PATH = os.environ.get("SEATS_CACHE_PATH", "/tmp/seats_cache.json")
+CACHE_TTL = 900  # seconds
+# Bump when match_flight() changes so stale filtered rows aren't served
+CACHE_FILTER_VERSION = 1
+
+# seats.aero rate limiting: a steady request rate, plus a pause whenever the
+# X-RateLimit-Remaining header says we're nearly out of quota
+RATE_LIMITER = AsyncLimiter(10, 1)
+RATE_LIMIT_FLOOR = 2
+_rate_limit_resume_at = 0.0
+
+def _env_positive_int(name, default):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed <= 0:
+        log.warning("⚠️ Invalid %s %r (expected whole seconds > 0), using %d", name, value, default)
+        return default
+    return parsed
+
+# Seconds between scans in --daemon mode
+SCAN_INTERVAL = _env_positive_int("SCAN_INTERVAL", 300)
+
+def _env_list(name, default):
+    """Comma-separated env override, e.g. MONITOR_ROUTES="JFK-HND,HND-JFK"."""
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return [item.strip().upper() for item in value.split(",") if item.strip()]
+
+# Optional "JL", optional spaces, leading zeros dropped from the number
+_FLIGHT_RE = re.compile(r"^\s*(?:JL)?\s*0*([0-9]+)\s*$", re.I)
 
 def normalize_flight_num(code):
     """
     Normalizes flight codes to match our set.
-    Ex: "JL006" -> "JL6", "JL 004" -> "JL4"
+    Ex: "JL006" -> "JL6", "JL 004" -> "JL4", "5" -> "JL5"
     """
-    if not code: return ""
-    code = str(code).replace(" ", "").upper()
+    code = str(code or "")
+    m = _FLIGHT_RE.match(code)
+    if m:
+        return f"JL{m.group(1)}"
+    return code.replace(" ", "").upper()
+
+# Shapes accepted from MONITOR_ROUTES / MONITOR_FLIGHTS
+_ROUTE_RE = re.compile(r"^[A-Z]{3}-[A-Z]{3}$")
+_TARGET_RE = re.compile(r"^JL[1-9][0-9]*$")
+
+def _parse_routes(routes):
+    parsed = []
+    for route in routes:
+        if not _ROUTE_RE.match(route):
+            log.warning("⚠️ Ignoring route %r (expected e.g. JFK-HND)", route)
+            continue
+        parsed.append(tuple(route.split("-")))
+    return parsed
+
+def _parse_flights(flights):
+    parsed = set()
+    for flight in flights:
+        code = normalize_flight_num(flight)
+        if not _TARGET_RE.match(code):
+            log.warning("⚠️ Ignoring flight %r (expected e.g. JL3)", flight)
+            continue
+        parsed.add(code)
+    return frozenset(parsed)
+
+# Everything that decides what we scan lives here
+CONFIG = {
+    # 1. Routes Reduced to JFK <-> HND only
+    "routes": _parse_routes(_env_list("MONITOR_ROUTES", ["JFK-HND", "HND-JFK"])),
+    # 2. Flight Filter Reduced to JL3/4/5/6
+    "target_flights": _parse_flights(_env_list("MONITOR_FLIGHTS", ["JL3", "JL4", "JL5", "JL6"])),
+    # Sources: American and Alaska
+    "sources": [
+        source.lower()
+        for source in _env_list("MONITOR_SOURCES", ["american", "alaska"])
+    ]
+}
+
+def check_config():
+    """Refuses to run (and overwrite results.json) with a config that searches nothing."""
+    empty = [name for name, values in CONFIG.items() if not values]
+    if empty:
+        log.error("❌ Error: no valid %s configured, nothing to scan.", ", ".join(empty))
+        sys.exit(1)
+
+# Human-readable labels for logs and alerts, e.g. "JFK-HND, HND-JFK" / "JL3/JL4/JL5/JL6"
+ROUTES_LABEL = ", ".join(f"{o}-{d}" for o, d in CONFIG["routes"])
+FLIGHTS_LABEL = "/".join(sorted(CONFIG["target_flights"]))
+
+# Every raw spelling (spaces stripped, upper-cased) that maps to a target,
+# e.g. "JL3", "JL03", "JL003", "3", "03", "003"
+ACCEPTED = frozenset(
+    f"{prefix}{pad}{code[2:]}"
+    for code in CONFIG["target_flights"]
+    for prefix in ("JL", "")
+    for pad in ("", "0", "00")
+)
+
+def load_cache():
+    try:
+        with open(CACHE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def save_cache(cache):
+    # Drop expired entries (in place, so a long-running daemon doesn't grow either)
+    now = time.time()
+    for key in [k for k, v in cache.items() if now - v[0] >= CACHE_TTL]:
+        del cache[key]
+    try:
+        with open(CACHE_PATH, "wb") as f:
+            f.write(orjson.dumps(cache))
+    except OSError as e:
+        log.warning("⚠️ Could not write cache: %s", e)
+
+def cache_key(params):
+    # The cache holds filtered rows, so the filter inputs are part of the key
+    key = {
+        "params": params,
+        "targets": sorted(CONFIG["target_flights"]),
+        "filter": CACHE_FILTER_VERSION
+    }
+    return hashlib.sha1(orjson.dumps(key, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+def load_notified():
+    try:
+        with open(NOTIFIED_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+def save_notified(notified):
+    now = time.time()
+    notified = {k: ts for k, ts in notified.items() if now - ts < NOTIFY_TTL}
+    with open(NOTIFIED_PATH, "wb") as f:
+        f.write(orjson.dumps(notified, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+
+def cabin_label(f):
+    cabin_list = []
+    if f.get("FAvailable"): cabin_list.append("FIRST")
+    if f.get("JAvailable"): cabin_list.append("BIZ")
+    return " + ".join(cabin_list)
+
+def alert_key(f):
+    # Each program prices the seat separately, so it gets its own alert
+    flight_num = f.get("NormalizedFlightNum", "JL??")
+    route = f"{f['Route']['OriginAirport']}-{f['Route']['DestinationAirport']}"
+    raw = f"{f.get('Date')}|{flight_num}|{cabin_label(f)}|{route}|{f.get('SourceProgram')}"
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+# Pulls the always-present filter fields in one C-level call; the cabin
+# flags are sometimes omitted, so those still go through .get()
+get_filter_fields = itemgetter("OperatingAirlineCode", "FlightNumber")
+
+def match_flight(flight):
+    """
+    Returns the normalized flight number if the row is a target flight's
+    Business/First availability, otherwise None.
+    """
+    try:
+        op_carrier, flight_num = get_filter_fields(flight)
+    except KeyError:
+        # No carrier or flight number means it can't be one of ours
+        return None
+
+    # 1. Filter Airline (JAL)
+    if not op_carrier or "JL" not in op_carrier: 
+        return None
     
-    # If it's just a number (e.g. 5), add JL
-    if code.isdigit():
-        return f"JL{int(code)}"
-        
-    # If it starts with JL, strip leading zeros
-    if code.startswith("JL"):
-        num_part = code[2:]
-        if num_part.isdigit():
-            return f"JL{int(num_part)}"
-            
-    return code
-
-def check_flights():
+    # 2. Filter Cabin (Business or First)
+    if not (flight.get("JAvailable", False) or flight.get("FAvailable", False)):
+        return None
+
+    # 3. Filter for Specific Flight Numbers
+    flight_num_raw = str(flight_num or "").replace(" ", "").upper()
+    if flight_num_raw in ACCEPTED:
+        return normalize_flight_num(flight_num_raw)
+
+    # Rare spellings the set doesn't cover (e.g. "JL0003") fall back to the regex
+    flight_code = normalize_flight_num(flight_num_raw)
+    if flight_code in CONFIG["target_flights"]:
+        return flight_code
+    return None
+
+async def iter_json_items(byte_stream, prefix):
+    """Incrementally yields the objects under prefix from an async byte stream."""
+    rows = ijson.sendable_list()
+    coro = ijson.items_coro(rows, prefix, use_float=True)
+    async for chunk in byte_stream:
+        coro.send(chunk)
+        for row in rows:
+            yield row
+        del rows[:]
+    coro.close()
+    for row in rows:
+        yield row
+
+class RateLimitedError(Exception):
+    pass
+
+def note_rate_limit(headers):
+    """Holds back further searches until the reset if the quota is nearly used up."""
+    global _rate_limit_resume_at
+    try:
+        remaining = int(headers.get("X-RateLimit-Remaining", 999))
+        reset = float(headers.get("X-RateLimit-Reset", 0))
+    except ValueError:
+        return
+
+    if remaining <= RATE_LIMIT_FLOOR and reset > 0:
+        now = time.monotonic()
+        if _rate_limit_resume_at <= now:
+            log.warning(
+                "⏳ seats.aero quota nearly used (%d left); new searches are held for %.0fs until it resets",
+                remaining, reset
+            )
+        _rate_limit_resume_at = max(_rate_limit_resume_at, now + reset)
+
+async def wait_for_rate_limit():
+    """Called before each scan, so a pause set by the last pass carries over (--daemon)."""
+    delay = _rate_limit_resume_at - time.monotonic()
+    if delay > 0:
+        log.info("⏳ Waiting %.0fs for the seats.aero quota to reset", delay)
+        await asyncio.sleep(delay)
+
+async def cached_get(client, cache, url, params, ttl=CACHE_TTL):
+    """
+    Returns the matching rows for a search. The response body is streamed
+    through ijson so the full 330-day array is never held in memory, and
+    only matches are kept (and cached).
+    """
+    key = cache_key(params)
+    entry = cache.get(key)
+    if entry and time.time() - entry[0] < ttl:
+        return entry[1]
+
+    matches = []
+    async with RATE_LIMITER:
+        # Searches still queued when the quota ran low are skipped, not stalled
+        if _rate_limit_resume_at > time.monotonic():
+            raise RateLimitedError("quota nearly used, search skipped until reset")
+        async with client.stream("GET", url, params=params) as resp:
+            note_rate_limit(resp.headers)
+            resp.raise_for_status()
+            async for flight in iter_json_items(resp.aiter_bytes(), "data.item"):
+                flight_code = match_flight(flight)
+                if flight_code:
+                    flight['NormalizedFlightNum'] = flight_code
+                    matches.append(flight)
+
+    # Only successful responses are cached; errors are retried next run
+    cache[key] = (time.time(), matches)
+    return matches
+
+async def _fetch(client, cache, queue, window, ttl, origin, dest, source):
+    url = "https://seats.aero/partnerapi/search"
+    params = {
+        "origin_airport": origin,
+        "destination_airport": dest,
+        "start_date": window[0],
+        "end_date": window[1],
+        "source": source
+    }
+    matches = await cached_get(client, cache, url, params, ttl)
+
+    # Hand matches to the notifier as soon as this search lands
+    for flight in matches:
+        flight['SourceProgram'] = source
+        if queue is not None:
+            await queue.put(flight)
+    return matches
+
+def make_client():
+    # All searches are multiplexed over one HTTP/2 connection
+    return httpx.AsyncClient(
+        http2=True,
+        headers={"Partner-Authorization": API_KEY or ""},
+        timeout=15
+    )
+
+async def check_flights(client, cache, queue=None, window=(START_STR, END_STR), ttl=CACHE_TTL):
     if not API_KEY:
-        print("❌ Error: SEATS_AERO_API_KEY is missing.")
+        log.error("❌ Error: SEATS_AERO_API_KEY is missing.")
         return []
 
-    url = "https://seats.aero/partnerapi/search"
-    headers = {"Partner-Authorization": API_KEY}
     found_flights = []
-    
-    # Sources: American and Alaska
-    sources = ["american", "alaska"]
 
-    print(f"🔎 Scanning JFK-HND (JL 3/4/5/6)...")
+    await wait_for_rate_limit()
+    log.info("🔎 Scanning %s (%s)...", ROUTES_LABEL, FLIGHTS_LABEL)
 
-    for origin, dest in ROUTES:
-        for source in sources:
-            params = {
-                "origin_airport": origin,
-                "destination_airport": dest,
-                "start_date": START_DATE.strftime("%Y-%m-%d"),
-                "end_date": END_DATE.strftime("%Y-%m-%d"),
-                "source": source
-            }
+    searches = [
+        (origin, dest, source)
+        for (origin, dest) in CONFIG["routes"]
+        for source in CONFIG["sources"]
+    ]
+    # Fire every route/source search at once
+    tasks = [_fetch(client, cache, queue, window, ttl, o, d, s) for (o, d, s) in searches]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            try:
-                resp = requests.get(url, headers=headers, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-            except Exception as e:
-                print(f"  ❌ Error {origin}->{dest} ({source}): {e}")
-                continue
-
-            for flight in data.get("data", []):
-                # 1. Filter Airline (JAL)
-                op_carrier = flight.get("OperatingAirlineCode") or ""
-                if "JL" not in op_carrier: 
-                    continue
-                
-                # 2. Filter Cabin (Business or First)
-                j_avail = flight.get("JAvailable", False)
-                f_avail = flight.get("FAvailable", False)
-                if not (j_avail or f_avail):
-                    continue
-
-                # 3. Filter for Specific Flight Numbers
-                flight_num_raw = flight.get("FlightNumber")
-                flight_code = normalize_flight_num(flight_num_raw)
-
-                if flight_code in TARGET_FLIGHTS:
-                    flight['SourceProgram'] = source
-                    flight['NormalizedFlightNum'] = flight_code
-                    found_flights.append(flight)
-            
-            # Brief pause
-            time.sleep(0.5)
+    for (origin, dest, source), data in zip(searches, results):
+        if isinstance(data, Exception):
+            log.error("❌ Error %s->%s (%s): %s", origin, dest, source, data)
+            continue
+
+        found_flights.extend(data)
 
     return found_flights
 
-def notify(flights):
-    if not flights:
-        print("✅ No JL3/4/5/6 award space found.")
-        return
+# Embed colour per award program
+SOURCE_COLORS = {"american": 0xC8102E, "alaska": 0x004165}
 
-    print(f"🚀 Found {len(flights)} seats! Sending Discord alert...")
-    
-    if not WEBHOOK_URL:
-        print("⚠️ No Webhook URL set.")
-        return
+# Static parts of every embed; only the values change per flight
+_EMBED_FIELDS = (
+    {"name": "📅 Date", "inline": True},
+    {"name": "💰 Cost", "inline": True},
+    {"name": "✈️ Flight", "inline": True}
+)
 
-    embeds = []
-    # Sort by date
-    flights.sort(key=lambda x: x['Date'])
-
-    for f in flights[:10]:
-        date = f.get("Date")
-        origin = f['Route']['OriginAirport']
-        dest = f['Route']['DestinationAirport']
-        flight_num = f.get("NormalizedFlightNum", "JL??")
-        source = f.get("SourceProgram")
-        
-        # Cabin Display
-        cabin_list = []
-        if f.get("FAvailable"): cabin_list.append("FIRST")
-        if f.get("JAvailable"): cabin_list.append("BIZ")
-        cabin_str = " + ".join(cabin_list)
-
-        # Cost Display
-        cost = f.get("JMileage") or f.get("FMileage")
-        cost_str = f"{int(cost):,} pts" if cost else "?"
-
-        deep_link = f"https://seats.aero/{source}/{origin}/{dest}/{date}"
-        color = 0xC8102E if source == 'american' else 0x004165
-
-        embed = {
-            "title": f"🇯🇵 {flight_num} {cabin_str} Found!",
-            "description": f"**{origin} ⇄ {dest}**",
-            "url": deep_link,
-            "color": color,
-            "fields": [
-                {"name": "📅 Date", "value": date, "inline": True},
-                {"name": "💰 Cost", "value": cost_str, "inline": True},
-                {"name": "✈️ Flight", "value": flight_num, "inline": True}
-            ]
-        }
-        embeds.append(embed)
+def build_embed(f):
+    date = f.get("Date")
+    route = f['Route']
+    origin = route['OriginAirport']
+    dest = route['DestinationAirport']
+    flight_num = f.get("NormalizedFlightNum", "JL??")
+    source = f.get("SourceProgram")
+
+    # Cost Display
+    cost = f.get("JMileage") or f.get("FMileage")
+    cost_str = f"{int(cost):,} pts" if cost else "?"
 
+    return {
+        "title": f"🇯🇵 {flight_num} {cabin_label(f)} Found!",
+        "description": f"**{origin} ⇄ {dest}**",
+        "url": f"https://seats.aero/{source}/{origin}/{dest}/{date}",
+        "color": SOURCE_COLORS.get(source, 0x004165),
+        "fields": [
+            {**field, "value": value}
+            for field, value in zip(_EMBED_FIELDS, (date, cost_str, flight_num))
+        ]
+    }
+
+def post_batch(batch):
     payload = {
-        "content": "🚨 **JFK-HND A35K Space Detected** 🚨", 
-        "embeds": embeds
+        "content": f"🚨 **{FLIGHTS_LABEL} Space Detected ({ROUTES_LABEL})** 🚨",
+        "embeds": [build_embed(f) for f in batch]
     }
-    
+
     try:
-        requests.post(WEBHOOK_URL, json=payload)
+        resp = SESSION.post(WEBHOOK_URL, json=payload, timeout=10)
+        resp.raise_for_status()
     except Exception as e:
-        print(f"❌ Failed to send Discord alert: {e}")
+        log.error("❌ Failed to send Discord alert: %s", e)
+        return False
+    return True
+
+async def notifier(queue, max_batch=10, max_wait=1.0):
+    """
+    Consumes flights from the queue while the searches are still running.
+    A batch is posted once it holds max_batch embeds (Discord's limit) or
+    max_wait seconds after its first flight arrived; a None sentinel
+    flushes whatever is left.
+    """
+    loop = asyncio.get_running_loop()
+    notified = load_notified()
+    queued = set()
+    batch = []
+    deadline = None
+    posted = False
+
+    async def flush():
+        nonlocal batch, posted
+        if not batch:
+            return
+        if posted:
+            # Stay under the webhook limit of 5 requests / 2s
+            await asyncio.sleep(0.4)
+        # Sort by date (ordering only holds within a single message)
+        batch.sort(key=itemgetter('Date'))
+        log.info("🚀 Sending %d seats to Discord...", len(batch))
+        if await asyncio.to_thread(post_batch, batch):
+            now = time.time()
+            for f in batch:
+                notified[alert_key(f)] = now
+        posted = True
+        batch = []
+
+    while True:
+        timeout = None if deadline is None else max(0, deadline - loop.time())
+        try:
+            flight = await asyncio.wait_for(queue.get(), timeout)
+        except asyncio.TimeoutError:
+            await flush()
+            deadline = None
+            continue
+
+        if flight is None:
+            break
+
+        # Skip anything we already alerted on in the last 24h, or queued this run
+        key = alert_key(flight)
+        if not WEBHOOK_URL or key in queued or time.time() - notified.get(key, 0) <= NOTIFY_TTL:
+            continue
+        queued.add(key)
+
+        if not batch:
+            deadline = loop.time() + max_wait
+        batch.append(flight)
+        if len(batch) >= max_batch:
+            await flush()
+            deadline = None
+
+    await flush()
+    if posted:
+        save_notified(notified)
 
 def save_to_json(flights):
     # Prepare the data for the frontend
@@ -182,12 +504,76 @@ def save_to_json(flights):
             "link": f"https://seats.aero/{f.get('SourceProgram')}/{f['Route']['OriginAirport']}/{f['Route']['DestinationAirport']}/{f.get('Date')}"
         })
 
+    # Skip the write (and the CI commit / Pages rebuild) if only the timestamp would change
+    new_body = orjson.dumps(output_data["flights"], option=orjson.OPT_SORT_KEYS)
+    try:
+        with open("results.json", "rb") as f:
+            old_flights = orjson.loads(f.read()).get("flights")
+        if orjson.dumps(old_flights, option=orjson.OPT_SORT_KEYS) == new_body:
+            log.info("✅ Results unchanged, skipping write")
+            return
+    except (OSError, orjson.JSONDecodeError, AttributeError):
+        pass
+
     # Write to a file in the root directory (so GitHub Pages can find it)
-    with open("results.json", "w") as f:
-        json.dump(output_data, f, indent=4)
-    print("✅ Saved results to results.json")
+    with open("results.json", "wb") as f:
+        f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    log.info("✅ Saved results to results.json")
+
+async def scan(client, cache, window=(START_STR, END_STR), ttl=CACHE_TTL):
+    # Discord posts overlap with the remaining seats.aero calls
+    queue = asyncio.Queue()
+    consumer = asyncio.create_task(notifier(queue))
+    try:
+        flights = await check_flights(client, cache, queue, window, ttl)
+    finally:
+        await queue.put(None)
+        await consumer
+
+    save_cache(cache)
+
+    if not flights:
+        log.info("✅ No %s award space found.", FLIGHTS_LABEL)
+
+    # Sort by date
+    flights.sort(key=itemgetter('Date'))
+    return flights
+
+async def main_once():
+    if not WEBHOOK_URL:
+        log.warning("⚠️ No Webhook URL set.")
+
+    async with make_client() as client:
+        flights = await scan(client, load_cache())
+    save_to_json(flights)
+
+async def main_loop(interval=SCAN_INTERVAL):
+    """
+    Keeps the HTTP/2 connection and the response cache warm between
+    scans instead of paying DNS + TLS setup on every cron tick. The cache
+    TTL is capped at the interval so every scan actually hits the API.
+    """
+    if not WEBHOOK_URL:
+        log.warning("⚠️ No Webhook URL set.")
+
+    ttl = min(CACHE_TTL, interval)
+    cache = load_cache()
+    async with make_client() as client:
+        while True:
+            # Slide the search window forward as the days pass
+            today = datetime.date.today()
+            window = (today.isoformat(), (today + datetime.timedelta(days=SEARCH_DAYS)).isoformat())
+
+            # One bad pass (e.g. a disk error) shouldn't kill the daemon
+            try:
+                flights = await scan(client, cache, window, ttl)
+                save_to_json(flights)
+            except Exception:
+                log.exception("❌ Scan failed")
+
+            log.info("💤 Next scan in %ds", interval)
+            await asyncio.sleep(interval)
 
 if __name__ == "__main__":
-    flights = check_flights()
-    notify(flights)
-    save_to_json(flights)
\ No newline at end of file
+    check_config()
+    asyncio.run(main_loop() if "--daemon" in sys.argv else main_once())
\ No newline at end of file